@@ -4,15 +4,24 @@
 
 import os
 import asyncio
-import subprocess
+import functools
+import io
+import itertools
+import logging
 import urllib3
 import re
 import sys
 import termios
+import threading
+import time
 import tty
-from typing import List, Tuple
+import yaml
+from collections import deque
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Tuple
 from kubernetes.client import V1Pod
-from kubernetes import client, config
+from kubernetes.client.rest import ApiException
+from kubernetes import client, config, watch
 from pydantic import BaseModel
 from typing import Literal, Optional, Union
 from pydantic_ai import Agent
@@ -21,6 +30,11 @@ from dotenv import load_dotenv
 # Disable urllib3 SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+logger = logging.getLogger("k8s-debug-agent")
+# Library-style logging: stay silent unless the embedding app configures it,
+# so background warnings never land in the middle of the raw-mode prompt.
+logger.addHandler(logging.NullHandler())
+
 # Load environment variables from .env file
 load_dotenv()
 AI_PROVIDER = os.environ.get("AI_PROVIDER", "openai").lower()
@@ -53,10 +67,12 @@ class ActionRequest(BaseModel):
         "DESCRIBE_DEPLOYMENT",
         "GET_CONFIGMAP",
         "GET_EVENTS",
+        "SUMMARIZE",
         "STOP",
     ]
     namespace: Optional[str] = None
     name: Optional[str] = None
+    summary: Optional[str] = None
 
 
 class FinalAnalysis(BaseModel):
@@ -70,34 +86,372 @@ AgentResponse = Union[ActionRequest, FinalAnalysis]
 # ----------------------------
 # K8s helpers
 # ----------------------------
+# API clients shared by every call so TCP/TLS connections are reused;
+# populated by init_k8s().
+_CORE_V1: Optional[client.CoreV1Api] = None
+_APPS_V1: Optional[client.AppsV1Api] = None
+_BATCH_V1: Optional[client.BatchV1Api] = None
+
+
 def init_k8s() -> None:
-    """Initialize Kubernetes client configuration.
+    """Initialize Kubernetes client configuration and the shared API clients.
 
     Attempts to load local kubeconfig first; if unavailable, falls back to
     in-cluster configuration (for when running inside a Kubernetes Pod).
+    All API groups share one ApiClient, and therefore one keep-alive
+    connection pool sized for the concurrent controller lookups, the pod
+    watch and speculative fetches. Idempotent requests are retried with
+    exponential backoff on connection errors and on 429/5xx responses from
+    an overloaded or restarting API server; once retries are exhausted the
+    last response is still surfaced as an ApiException.
+    The Python client can only decode JSON (it ships no protobuf models), so
+    responses are requested gzip-compressed to cut wire bytes on large lists;
+    urllib3 inflates them transparently.
     """
+    global _CORE_V1, _APPS_V1, _BATCH_V1
     try:
         config.load_kube_config()
     except:
         config.load_incluster_config()
 
+    cfg = client.Configuration.get_default_copy()
+    cfg.connection_pool_maxsize = 64
+    cfg.retries = urllib3.Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False,
+    )
+    api_client = client.ApiClient(cfg)
+    api_client.set_default_header("Accept-Encoding", "gzip")
+    _CORE_V1 = client.CoreV1Api(api_client)
+    _APPS_V1 = client.AppsV1Api(api_client)
+    _BATCH_V1 = client.BatchV1Api(api_client)
 
-def run_cmd(cmd: List[str]) -> str:
-    """Execute a shell command and return its stdout as text.
 
-    Args:
-        cmd: Command and arguments as a list, e.g. ["kubectl", "get", "pods"].
+# Number of trailing log lines fetched for a LOGS action
+LOG_TAIL_LINES = 100
 
-    Returns:
-        Command output as a string. On failure, returns a formatted error message.
+# Read buffer used when streaming a log response
+LOG_READ_BUFFER_SIZE = 1 << 20
+
+# Page size for list calls; large enough that most clusters need one request
+LIST_CHUNK_SIZE = 5000
+
+
+def list_all(list_func, **kwargs):
+    """Call a Kubernetes list endpoint and return all items in one list object.
+
+    Requests pages of LIST_CHUNK_SIZE items and follows the continue token
+    when the server still splits the response, appending each page's items to
+    the first page.
+    """
+    result = list_func(limit=LIST_CHUNK_SIZE, **kwargs)
+    token = result.metadata._continue
+    # The API server rejects an explicit resourceVersion alongside continue
+    kwargs.pop("resource_version", None)
+    kwargs.pop("resource_version_match", None)
+    while token:
+        page = list_func(limit=LIST_CHUNK_SIZE, _continue=token, **kwargs)
+        result.items.extend(page.items)
+        token = page.metadata._continue
+    return result
+
+
+def _format_api_error(what: str, e: Exception) -> str:
+    """Format a Kubernetes API failure for display and model context."""
+    if isinstance(e, ApiException):
+        return f"❌ Error {what}: ({e.status}) {e.reason}\n{e.body}"
+    return f"❌ Error {what}:\n{e}"
+
+
+def _format_timestamp(ts: Optional[datetime]) -> str:
+    """Render an API timestamp the way ``kubectl describe`` does."""
+    if ts is None:
+        return "<unknown>"
+    return ts.strftime("%a, %d %b %Y %H:%M:%S %z")
+
+
+def _format_age(ts: Optional[datetime]) -> str:
+    """Render a short relative age such as ``5m`` or ``3d``."""
+    if ts is None:
+        return "<unknown>"
+    seconds = int((datetime.now(timezone.utc) - ts).total_seconds())
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{seconds // size}{unit}"
+    return f"{max(seconds, 0)}s"
+
+
+def _format_mapping(title: str, mapping: Optional[dict], indent: str = "") -> List[str]:
+    """Render labels/annotations style key=value blocks."""
+    if not mapping:
+        return [f"{indent}{title}<none>"]
+    pad = " " * len(title)
+    items = [f"{k}={v}" for k, v in sorted(mapping.items())]
+    return [f"{indent}{title}{items[0]}"] + [f"{indent}{pad}{i}" for i in items[1:]]
+
+
+def _format_container_state(label: str, state) -> List[str]:
+    """Render a V1ContainerState (waiting/running/terminated)."""
+    if state is None:
+        return []
+    if state.waiting:
+        lines = [f"    {label}Waiting"]
+        if state.waiting.reason:
+            lines.append(f"      Reason:       {state.waiting.reason}")
+        return lines
+    if state.running:
+        return [
+            f"    {label}Running",
+            f"      Started:      {_format_timestamp(state.running.started_at)}",
+        ]
+    if state.terminated:
+        t = state.terminated
+        lines = [f"    {label}Terminated"]
+        if t.reason:
+            lines.append(f"      Reason:       {t.reason}")
+        lines.append(f"      Exit Code:    {t.exit_code}")
+        lines.append(f"      Started:      {_format_timestamp(t.started_at)}")
+        lines.append(f"      Finished:     {_format_timestamp(t.finished_at)}")
+        return lines
+    return []
+
+
+def _format_containers(title: str, containers, statuses) -> List[str]:
+    """Render the container section of a pod or pod template description."""
+    if not containers:
+        return []
+    status_by_name = {cs.name: cs for cs in statuses or []}
+    lines = [f"{title}:"]
+    for c in containers:
+        lines.append(f"  {c.name}:")
+        lines.append(f"    Image:          {c.image}")
+        ports = ", ".join(
+            f"{p.container_port}/{p.protocol or 'TCP'}" for p in c.ports or []
+        )
+        lines.append(f"    Port:           {ports or '<none>'}")
+        cs = status_by_name.get(c.name)
+        if cs is not None:
+            lines.extend(_format_container_state("State:          ", cs.state))
+            lines.extend(_format_container_state("Last State:     ", cs.last_state))
+            lines.append(f"    Ready:          {cs.ready}")
+            lines.append(f"    Restart Count:  {cs.restart_count}")
+        if c.resources:
+            for section, values in (
+                ("Limits", c.resources.limits),
+                ("Requests", c.resources.requests),
+            ):
+                if values:
+                    lines.append(f"    {section}:")
+                    lines.extend(f"      {k}: {v}" for k, v in sorted(values.items()))
+        if c.env:
+            lines.append("    Environment:")
+            for env in c.env:
+                source = env.value_from
+                if env.value is not None:
+                    value = env.value
+                elif source is not None and source.secret_key_ref:
+                    ref = source.secret_key_ref
+                    value = f"<set to the key '{ref.key}' in secret '{ref.name}'>"
+                elif source is not None and source.config_map_key_ref:
+                    ref = source.config_map_key_ref
+                    value = f"<set to the key '{ref.key}' of config map '{ref.name}'>"
+                elif source is not None:
+                    value = "<set from field or resource reference>"
+                else:
+                    value = ""
+                lines.append(f"      {env.name}: {value}")
+    return lines
+
+
+def _format_conditions(conditions) -> List[str]:
+    """Render a list of status conditions as a small table."""
+    if not conditions:
+        return []
+    lines = ["Conditions:", "  Type\tStatus\tReason"]
+    for cond in conditions:
+        lines.append(f"  {cond.type}\t{cond.status}\t{cond.reason or ''}")
+    return lines
+
+
+def _format_events(events) -> List[str]:
+    """Render events oldest-first, similar to ``kubectl get events``."""
+    if not events:
+        return ["Events:  <none>"]
+
+    def _last_seen(ev):
+        return ev.last_timestamp or ev.event_time or ev.metadata.creation_timestamp
+
+    lines = ["Events:", "  Last Seen\tType\tReason\tObject\tMessage"]
+    oldest = datetime.min.replace(tzinfo=timezone.utc)
+    for ev in sorted(events, key=lambda e: _last_seen(e) or oldest):
+        obj = f"{(ev.involved_object.kind or '').lower()}/{ev.involved_object.name}"
+        message = (ev.message or "").strip()
+        lines.append(
+            f"  {_format_age(_last_seen(ev))}\t{ev.type}\t{ev.reason}\t{obj}\t{message}"
+        )
+    return lines
+
+
+def describe_pod(name: str, namespace: str) -> str:
+    """Describe a Pod and its events using the Kubernetes API.
+
+    Produces a condensed, ``kubectl describe pod``-like text report.
     """
     try:
-        return subprocess.check_output(cmd, text=True)
-    except subprocess.CalledProcessError as e:
-        return f"❌ Error executing {' '.join(cmd)}:\n{e.output}"
+        pod = _CORE_V1.read_namespaced_pod(name=name, namespace=namespace)
+        events = _CORE_V1.list_namespaced_event(
+            namespace=namespace, field_selector=f"involvedObject.name={name}"
+        ).items
+    except Exception as e:
+        return _format_api_error(f"describing pod {namespace}/{name}", e)
+
+    meta, spec, status = pod.metadata, pod.spec, pod.status
+    owners = ", ".join(f"{r.kind}/{r.name}" for r in meta.owner_references or [])
+    lines = [
+        f"Name:             {meta.name}",
+        f"Namespace:        {meta.namespace}",
+        f"Service Account:  {spec.service_account_name}",
+        f"Node:             {spec.node_name or '<none>'}",
+        f"Start Time:       {_format_timestamp(status.start_time)}",
+    ]
+    lines.extend(_format_mapping("Labels:           ", meta.labels))
+    lines.append(f"Status:           {status.phase}")
+    if status.reason:
+        lines.append(f"Reason:           {status.reason}")
+    if status.message:
+        lines.append(f"Message:          {status.message}")
+    lines.append(f"IP:               {status.pod_ip or '<none>'}")
+    lines.append(f"Controlled By:    {owners or '<none>'}")
+    lines.extend(
+        _format_containers(
+            "Init Containers", spec.init_containers, status.init_container_statuses
+        )
+    )
+    lines.extend(
+        _format_containers("Containers", spec.containers, status.container_statuses)
+    )
+    lines.extend(_format_conditions(status.conditions))
+    lines.extend(_format_events(events))
+    return "\n".join(lines)
 
 
-def resolve_controller_for_pod(pod: V1Pod) -> Tuple[Optional[str], Optional[str]]:
+def get_pod_logs(name: str, namespace: str, container: Optional[str] = None) -> str:
+    """Return the last LOG_TAIL_LINES log lines of a Pod (optionally a container).
+
+    The log is read as a stream into a bounded deque rather than buffered
+    whole, so memory stays capped even if the server sends more than asked.
+    """
+    try:
+        resp = _CORE_V1.read_namespaced_pod_log(
+            name=name,
+            namespace=namespace,
+            container=container,
+            tail_lines=LOG_TAIL_LINES,
+            _preload_content=False,
+        )
+        resp.auto_close = False
+        try:
+            # Decode explicitly and leniently: container logs are not
+            # guaranteed to be valid UTF-8. A large read buffer keeps the
+            # number of socket reads low for big log tails.
+            reader = io.BufferedReader(resp, buffer_size=LOG_READ_BUFFER_SIZE)
+            text = io.TextIOWrapper(reader, encoding="utf-8", errors="replace")
+            tail = deque(text, maxlen=LOG_TAIL_LINES)
+        finally:
+            resp.release_conn()
+        return "".join(tail)
+    except Exception as e:
+        return _format_api_error(f"fetching logs for {namespace}/{name}", e)
+
+
+def describe_deployment(name: str, namespace: str) -> str:
+    """Describe a Deployment and its events using the Kubernetes API."""
+    try:
+        deploy = _APPS_V1.read_namespaced_deployment(name=name, namespace=namespace)
+        events = _CORE_V1.list_namespaced_event(
+            namespace=namespace, field_selector=f"involvedObject.name={name}"
+        ).items
+    except Exception as e:
+        return _format_api_error(f"describing deployment {namespace}/{name}", e)
+
+    meta, spec, status = deploy.metadata, deploy.spec, deploy.status
+    selector = ",".join(
+        f"{k}={v}" for k, v in sorted((spec.selector.match_labels or {}).items())
+    )
+    lines = [
+        f"Name:               {meta.name}",
+        f"Namespace:          {meta.namespace}",
+        f"CreationTimestamp:  {_format_timestamp(meta.creation_timestamp)}",
+    ]
+    lines.extend(_format_mapping("Labels:             ", meta.labels))
+    lines.append(f"Selector:           {selector or '<none>'}")
+    lines.append(
+        f"Replicas:           {spec.replicas} desired | "
+        f"{status.updated_replicas or 0} updated | "
+        f"{status.replicas or 0} total | "
+        f"{status.available_replicas or 0} available | "
+        f"{status.unavailable_replicas or 0} unavailable"
+    )
+    lines.append(f"StrategyType:       {spec.strategy.type if spec.strategy else ''}")
+    lines.append("Pod Template:")
+    lines.extend(
+        "  " + line
+        for line in _format_containers(
+            "Init Containers", spec.template.spec.init_containers, None
+        )
+        + _format_containers("Containers", spec.template.spec.containers, None)
+    )
+    lines.extend(_format_conditions(status.conditions))
+    lines.extend(_format_events(events))
+    return "\n".join(lines)
+
+
+def get_configmap(name: str, namespace: str) -> str:
+    """Return a ConfigMap rendered as YAML."""
+    try:
+        cm = _CORE_V1.read_namespaced_config_map(name=name, namespace=namespace)
+    except Exception as e:
+        return _format_api_error(f"fetching configmap {namespace}/{name}", e)
+    data = _CORE_V1.api_client.sanitize_for_serialization(cm)
+    return yaml.safe_dump(data, sort_keys=False)
+
+
+def get_events(namespace: str) -> str:
+    """Return all events in a namespace, oldest first."""
+    try:
+        events = _CORE_V1.list_namespaced_event(namespace=namespace).items
+    except Exception as e:
+        return _format_api_error(f"listing events in {namespace}", e)
+    return "\n".join(_format_events(events))
+
+
+def list_replica_set_owners(namespace: str) -> Dict[Tuple[str, str], Optional[str]]:
+    """Map every ReplicaSet in a namespace to its controlling Deployment.
+
+    Returns:
+        Dict of (namespace, replicaset_name) -> deployment name, or None for
+        ReplicaSets without a Deployment controller.
+    """
+    owners = {}
+    for rs in list_all(_APPS_V1.list_namespaced_replica_set, namespace=namespace).items:
+        ref = next(
+            (
+                r
+                for r in rs.metadata.owner_references or ()
+                if getattr(r, "controller", False) and r.kind == "Deployment"
+            ),
+            None,
+        )
+        owners[(namespace, rs.metadata.name)] = ref.name if ref else None
+    return owners
+
+
+def resolve_controller_for_pod(
+    pod: V1Pod,
+    replica_set_owners: Optional[Dict[Tuple[str, str], Optional[str]]] = None,
+) -> Tuple[Optional[str], Optional[str]]:
     """Resolve the higher-level controller that manages a Pod.
 
     Resolves common ownership chains such as ReplicaSet→Deployment, and returns
@@ -105,21 +459,18 @@ def resolve_controller_for_pod(pod: V1Pod) -> Tuple[Optional[str], Optional[str]
 
     Args:
         pod: A V1Pod object.
+        replica_set_owners: Optional result of list_replica_set_owners; a
+            ReplicaSet found there is resolved without reading it again.
 
     Returns:
         Tuple of (kind, name) for the controller, or (None, None) if unknown.
     """
     try:
-        apps_v1 = client.AppsV1Api()
-        batch_v1 = client.BatchV1Api()
         owner_refs = pod.metadata.owner_references or []
-        controller_ref = None
-        for ref in owner_refs:
-            if getattr(ref, "controller", False):
-                controller_ref = ref
-                break
-        if controller_ref is None and owner_refs:
-            controller_ref = owner_refs[0]
+        controller_ref = next(
+            (r for r in owner_refs if getattr(r, "controller", False)),
+            owner_refs[0] if owner_refs else None,
+        )
 
         if not controller_ref:
             return (None, None)
@@ -129,8 +480,15 @@ def resolve_controller_for_pod(pod: V1Pod) -> Tuple[Optional[str], Optional[str]
         namespace = pod.metadata.namespace
 
         if kind == "ReplicaSet":
+            if replica_set_owners and (namespace, name) in replica_set_owners:
+                deployment = replica_set_owners[(namespace, name)]
+                if deployment:
+                    return ("Deployment", deployment)
+                return ("ReplicaSet", name)
             try:
-                rs = apps_v1.read_namespaced_replica_set(name=name, namespace=namespace)
+                rs = _APPS_V1.read_namespaced_replica_set(
+                    name=name, namespace=namespace
+                )
                 rs_owners = rs.metadata.owner_references or []
                 for ref in rs_owners:
                     if getattr(ref, "controller", False) and ref.kind == "Deployment":
@@ -144,7 +502,7 @@ def resolve_controller_for_pod(pod: V1Pod) -> Tuple[Optional[str], Optional[str]
 
         if kind == "Job":
             try:
-                job = batch_v1.read_namespaced_job(name=name, namespace=namespace)
+                job = _BATCH_V1.read_namespaced_job(name=name, namespace=namespace)
                 job.metadata  # touch to ensure fetched
                 return ("Job", name)
             except Exception:
@@ -155,30 +513,155 @@ def resolve_controller_for_pod(pod: V1Pod) -> Tuple[Optional[str], Optional[str]
         return (None, None)
 
 
-def get_failing_pods(
-    namespace: Optional[str] = None,
+class PodCache:
+    """In-memory Pod store kept current by a background watch.
+
+    Lists Pods once to seed the store and obtain a resourceVersion, then a
+    daemon thread watches from that version and applies ADDED/MODIFIED/DELETED
+    events. Reads are served locally, so re-scanning for failing pods during a
+    session does not re-list the cluster.
+    """
+
+    # Succeeded pods are never reported, so filter them out server-side.
+    FIELD_SELECTOR = "status.phase!=Succeeded"
+    WATCH_TIMEOUT_SECONDS = 300
+    MAX_BACKOFF_SECONDS = 60
+
+    def __init__(self, namespace: Optional[str] = None) -> None:
+        self.namespace = namespace
+        self._pods: Dict[Tuple[str, str], V1Pod] = {}
+        self._lock = threading.Lock()
+        # Last watch failure, or None while the store is being kept current.
+        self.watch_error: Optional[str] = None
+
+    def _list_call(self) -> Tuple[Callable, dict]:
+        """Return the list endpoint and its scope kwargs.
+
+        The bound API method is passed as is (not wrapped) because
+        kubernetes.watch derives the event model type from its docstring.
+        """
+        if self.namespace:
+            return _CORE_V1.list_namespaced_pod, {"namespace": self.namespace}
+        return _CORE_V1.list_pod_for_all_namespaces, {}
+
+    def _relist(self) -> str:
+        """Replace the store with a fresh list and return its resourceVersion."""
+        # Serve the list from the API server's watch cache rather than etcd.
+        list_func, scope = self._list_call()
+        pods = list_all(
+            list_func,
+            **scope,
+            field_selector=self.FIELD_SELECTOR,
+            resource_version="0",
+            resource_version_match="NotOlderThan",
+            watch=False,
+        )
+        with self._lock:
+            self._pods = {
+                (p.metadata.namespace, p.metadata.name): p for p in pods.items
+            }
+        return pods.metadata.resource_version
+
+    def start(self) -> None:
+        """Seed the store synchronously, then keep it current in the background."""
+        resource_version = self._relist()
+        threading.Thread(
+            target=self._watch, args=(resource_version,), daemon=True
+        ).start()
+
+    def _watch(self, resource_version: Optional[str]) -> None:
+        """Apply watch events to the store until the credentials are refused.
+
+        Failures are retried with capped exponential backoff; a failing streak
+        is logged once and recorded in ``watch_error`` until events flow again.
+        """
+        w = watch.Watch()
+        list_func, scope = self._list_call()
+        backoff = 1
+        while True:
+            try:
+                if resource_version is None:
+                    resource_version = self._relist()
+                for event in w.stream(
+                    list_func,
+                    **scope,
+                    field_selector=self.FIELD_SELECTOR,
+                    resource_version=resource_version,
+                    allow_watch_bookmarks=True,
+                    timeout_seconds=self.WATCH_TIMEOUT_SECONDS,
+                    # Bound connect and per-read waits so a half-open
+                    # connection surfaces as an error instead of hanging.
+                    _request_timeout=(10, self.WATCH_TIMEOUT_SECONDS + 30),
+                ):
+                    if self.watch_error is not None:
+                        logger.info("Pod watch recovered")
+                        self.watch_error = None
+                        backoff = 1
+                    if event["type"] not in ("ADDED", "MODIFIED", "DELETED"):
+                        continue
+                    pod = event["object"]
+                    key = (pod.metadata.namespace, pod.metadata.name)
+                    with self._lock:
+                        if event["type"] == "DELETED":
+                            self._pods.pop(key, None)
+                        else:
+                            self._pods[key] = pod
+                resource_version = w.resource_version or resource_version
+                continue
+            except ApiException as e:
+                if e.status == 410:
+                    # Our resourceVersion expired; start over from a new list.
+                    resource_version = None
+                    continue
+                error = f"({e.status}) {e.reason}"
+                if e.status in (401, 403):
+                    # Retrying cannot fix missing credentials or RBAC.
+                    self.watch_error = error
+                    logger.warning("Pod watch stopped: %s", error)
+                    return
+            except Exception as e:
+                error = str(e) or type(e).__name__
+            if resource_version is not None:
+                resource_version = w.resource_version or resource_version
+            if self.watch_error is None:
+                logger.warning("Pod watch failing, retrying: %s", error)
+            else:
+                logger.debug("Pod watch still failing: %s", error)
+            self.watch_error = error
+            time.sleep(backoff)
+            backoff = min(backoff * 2, self.MAX_BACKOFF_SECONDS)
+
+    def pods(self) -> List[V1Pod]:
+        """Return a snapshot of the cached Pods, ordered by namespace and name."""
+        with self._lock:
+            return [pod for _, pod in sorted(self._pods.items())]
+
+    def get(self, namespace: str, name: str) -> Optional[V1Pod]:
+        """Return a cached Pod by namespace and name, if present."""
+        with self._lock:
+            return self._pods.get((namespace, name))
+
+
+async def get_failing_pods(
+    pod_cache: PodCache,
 ) -> List[Tuple[str, str, str, Optional[str], Optional[str]]]:
-    """List pods that are not Ready across selected namespace or all namespaces.
+    """List pods that are not Ready in the cached namespace or all namespaces.
 
     Determines non-ready pods via the Pod Ready condition, deriving a reason
     from the condition, container states, or pod phase. Excludes pods with
-    reason "PodCompleted".
+    reason "PodCompleted". Pods are read from the watch-backed cache,
+    ReplicaSets are listed once per involved namespace, and the remaining
+    controller lookups are issued concurrently, so their latency is paid
+    roughly once rather than per pod.
 
     Returns:
         A list of tuples: (namespace, name, reason, controller_kind, controller_name).
     """
-    v1 = client.CoreV1Api()
-    if namespace:
-        pods = v1.list_namespaced_pod(namespace=namespace, watch=False)
-    else:
-        pods = v1.list_pod_for_all_namespaces(watch=False)
     not_ready = []
-    for pod in pods.items:
-        ready_condition = None
-        for condition in pod.status.conditions or []:
-            if condition.type == "Ready":
-                ready_condition = condition
-                break
+    for pod in pod_cache.pods():
+        ready_condition = next(
+            (c for c in pod.status.conditions or () if c.type == "Ready"), None
+        )
 
         is_ready = (
             ready_condition is not None
@@ -194,7 +677,8 @@ def get_failing_pods(
                 )
 
             if not reason:
-                container_reasons = []
+                # Insertion-ordered dedup of container reasons
+                container_reasons = {}
                 for cs in pod.status.container_statuses or []:
                     state = getattr(cs, "state", None)
                     if not state:
@@ -202,11 +686,11 @@ def get_failing_pods(
                     waiting = getattr(state, "waiting", None)
                     terminated = getattr(state, "terminated", None)
                     if waiting and getattr(waiting, "reason", None):
-                        container_reasons.append(waiting.reason)
+                        container_reasons[waiting.reason] = None
                     if terminated and getattr(terminated, "reason", None):
-                        container_reasons.append(terminated.reason)
+                        container_reasons[terminated.reason] = None
                 if container_reasons:
-                    reason = ", ".join(sorted(set(container_reasons)))
+                    reason = ", ".join(container_reasons)
 
             if not reason:
                 reason = pod.status.phase or "NotReady"
@@ -215,18 +699,33 @@ def get_failing_pods(
             if reason == "PodCompleted":
                 continue
 
-            controller_kind, controller_name = resolve_controller_for_pod(pod)
-            not_ready.append(
-                (
-                    pod.metadata.namespace,
-                    pod.metadata.name,
-                    reason,
-                    controller_kind,
-                    controller_name,
-                )
-            )
-
-    return not_ready
+            not_ready.append((pod, reason))
+
+    # One ReplicaSet list per involved namespace instead of a read per pod;
+    # namespaces whose list fails fall back to per-pod reads.
+    rs_namespaces = {
+        pod.metadata.namespace
+        for pod, _ in not_ready
+        if any(r.kind == "ReplicaSet" for r in pod.metadata.owner_references or ())
+    }
+    replica_set_owners = {}
+    for owners in await asyncio.gather(
+        *(asyncio.to_thread(list_replica_set_owners, ns) for ns in rs_namespaces),
+        return_exceptions=True,
+    ):
+        if isinstance(owners, dict):
+            replica_set_owners.update(owners)
+
+    controllers = await asyncio.gather(
+        *(
+            asyncio.to_thread(resolve_controller_for_pod, pod, replica_set_owners)
+            for pod, _ in not_ready
+        )
+    )
+    return [
+        (pod.metadata.namespace, pod.metadata.name, reason, kind, name)
+        for (pod, reason), (kind, name) in zip(not_ready, controllers)
+    ]
 
 
 # ----------------------------
@@ -240,6 +739,10 @@ You can:
 - Request more info by returning ActionRequest
 - Or conclude with FinalAnalysis
 
+Only the most recent results are kept in your context. To carry earlier
+findings forward, return an ActionRequest of type SUMMARIZE with a
+one-paragraph `summary`; it replaces the previous summary.
+
 Always return JSON that matches the schema.
 """
 ).strip()
@@ -254,11 +757,88 @@ agent = Agent[AgentResponse](
 # ----------------------------
 # Chat loop
 # ----------------------------
+# Number of recent results (actions, analyses) kept in the model prompt
+CONTEXT_WINDOW = 3
+
+# User phrasings that almost always lead the model to a given action
+_INTENT_PATTERNS = [
+    (re.compile(r"\blogs?\b", re.IGNORECASE), "LOGS"),
+    (re.compile(r"\bdescribe\b(?!.*\bdeploy)", re.IGNORECASE), "DESCRIBE_POD"),
+    (re.compile(r"\bevents?\b", re.IGNORECASE), "GET_EVENTS"),
+]
+
+
+def _action_target(action_type: str, namespace: str, name: Optional[str]) -> tuple:
+    """Identify what an action fetches, for matching speculative results."""
+    if action_type == "GET_EVENTS":
+        return (action_type, namespace)
+    return (action_type, namespace, name)
+
+
+def start_speculative_action(
+    user_input: str, ns: str, pod: str, pod_cache: PodCache
+) -> Tuple[Optional[tuple], Optional[asyncio.Task]]:
+    """Start the cluster call the user's message most likely leads to.
+
+    The call runs in a worker thread concurrently with the model request. The
+    caller awaits the task when the model asks for the same action on the same
+    target, and cancels it otherwise (the result is then discarded).
+
+    Returns:
+        Tuple of (target, task), or (None, None) when no intent is recognised.
+    """
+    action = next((a for p, a in _INTENT_PATTERNS if p.search(user_input)), None)
+    if action == "DESCRIBE_POD":
+        fetch = functools.partial(describe_pod, pod, ns)
+    elif action == "GET_EVENTS":
+        fetch = functools.partial(get_events, ns)
+    elif action == "LOGS":
+        # Only speculate when no container prompt will be needed
+        pod_obj = pod_cache.get(ns, pod)
+        if pod_obj is None:
+            return (None, None)
+        names = {
+            c.name
+            for c in itertools.chain(
+                pod_obj.spec.init_containers or (), pod_obj.spec.containers or ()
+            )
+        }
+        if len(names) != 1:
+            return (None, None)
+        fetch = functools.partial(get_pod_logs, pod, ns, container=names.pop())
+    else:
+        return (None, None)
+    task = asyncio.create_task(asyncio.to_thread(fetch))
+    return (_action_target(action, ns, pod), task)
+
+
+# Bullet markers ('-', '*', '•') and numbered bullets not at start of line
+_BULLET_RE = re.compile(r"(?<!^)(?<!\n)([-•*]\s+)")
+_NUM_BULLET_RE = re.compile(r"(?<!^)(?<!\n)(\d+\.\s+)")
+
+
+def _format_bullets(text: str) -> str:
+    """Put each bullet of a remediation text on its own line."""
+    text = _BULLET_RE.sub(r"\n\1", text)
+    return _NUM_BULLET_RE.sub(r"\n\1", text)
+
+
+def print_failing_pods(
+    pods: List[Tuple[str, str, str, Optional[str], Optional[str]]],
+) -> None:
+    """Print the numbered list of failing pods with their controllers."""
+    print("\n🚨 Failing pods detected:")
+    for i, (ns, pod, reason, ctrl_kind, ctrl_name) in enumerate(pods, 1):
+        ctrl_info = f", {ctrl_kind}={ctrl_name}" if ctrl_kind and ctrl_name else ""
+        print(f"{i}. {pod} (ns={ns}, reason={reason}{ctrl_info})")
+
+
 async def chat_loop(
     ns: str,
     pod: str,
     reason: str,
     all_pods: List[Tuple[str, str, str, Optional[str], Optional[str]]],
+    pod_cache: PodCache,
 ) -> None:
     """Interactive debugging loop for a selected pod.
 
@@ -271,10 +851,22 @@ async def chat_loop(
         pod: Name of the selected pod.
         reason: Brief reason the pod is not ready.
         all_pods: List of failing pod tuples to allow switching.
+        pod_cache: Watch-backed Pod cache used to refresh the failing list.
     """
-    context = f"Pod {pod} in namespace {ns} is failing: {reason}"
+    # The prompt is bounded: the pod header, its latest description, a
+    # model-maintained summary and the last CONTEXT_WINDOW results.
+    header = f"Pod {pod} in namespace {ns} is failing: {reason}"
+    pod_description: Optional[str] = None
+    summary: Optional[str] = None
+    history: deque = deque(maxlen=CONTEXT_WINDOW)
     print("\n💬 Interactive Debugging Session Started")
-    print("Type 'exit' to quit. Press CTRL+n to switch to next pod.\n")
+    print(
+        "Type 'exit' to quit, 'refresh' to re-scan failing pods. "
+        "Press CTRL+n to switch to next pod.\n"
+    )
+
+    # Bytes read past the end of the previous line (e.g. a multi-line paste)
+    pending = bytearray()
 
     def read_user_input_or_ctrl_n(prompt: str) -> Tuple[str, bool]:
         """Read a line of input or detect Ctrl+n.
@@ -282,54 +874,84 @@ async def chat_loop(
         Returns a tuple (text, is_ctrl_n). When Ctrl+n is pressed, text is
         an empty string and is_ctrl_n is True. Otherwise, returns the typed
         text with is_ctrl_n False.
+
+        Input is read in chunks of whatever the terminal delivers and echoed
+        with one write per chunk, so pasting a long prompt does not cost a
+        read and a write syscall per character.
         """
         fd = sys.stdin.fileno()
+        out_fd = sys.stdout.fileno()
         old_settings = termios.tcgetattr(fd)
         try:
             tty.setraw(fd)
-            buffer = []
+            buffer = bytearray()
             sys.stdout.write(prompt)
             sys.stdout.flush()
             while True:
-                ch = sys.stdin.read(1)
-                if ch == "\x0e":  # CTRL+n
-                    sys.stdout.write("\n")
-                    sys.stdout.flush()
-                    return ("", True)
-                if ch in ("\r", "\n"):
-                    sys.stdout.write("\n")
-                    sys.stdout.flush()
-                    return ("".join(buffer).strip(), False)
-                if ch == "\x7f":  # Backspace
-                    if buffer:
-                        buffer.pop()
-                        sys.stdout.write("\b \b")
-                        sys.stdout.flush()
-                    continue
-                # Basic printable range; skip other control chars
-                if "\x20" <= ch <= "\x7e":
-                    buffer.append(ch)
-                    sys.stdout.write(ch)
-                    sys.stdout.flush()
+                chunk = bytes(pending) or os.read(fd, 4096)
+                pending.clear()
+                if not chunk:  # EOF
+                    os.write(out_fd, b"\n")
+                    return ("exit", False)
+                echo = bytearray()
+                for i, byte in enumerate(chunk):
+                    if byte == 0x0E:  # CTRL+n
+                        pending.extend(chunk[i + 1 :])
+                        os.write(out_fd, bytes(echo) + b"\n")
+                        return ("", True)
+                    if byte in (0x0D, 0x0A):  # CR / LF
+                        pending.extend(chunk[i + 1 :])
+                        os.write(out_fd, bytes(echo) + b"\n")
+                        return (buffer.decode("ascii").strip(), False)
+                    if byte == 0x7F:  # Backspace
+                        if buffer:
+                            buffer.pop()
+                            echo.extend(b"\b \b")
+                        continue
+                    # Basic printable range; skip other control chars
+                    if 0x20 <= byte <= 0x7E:
+                        buffer.append(byte)
+                        echo.append(byte)
+                if echo:
+                    os.write(out_fd, bytes(echo))
         finally:
             termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
-    # Track current selection index for CTRL+n cycling
-    try:
-        current_idx = next(
-            i
-            for i, t in enumerate(all_pods)
-            if t[0] == ns and t[1] == pod and t[2] == reason
-        )
-    except StopIteration:
-        current_idx = 0
+    def _emit_remediation(text: str, emitted: str, final: bool = False) -> str:
+        """Write the not-yet-printed part of a (partial) remediation.
+
+        Returns the formatted text printed so far. While streaming, the
+        trailing word is held back because a bullet marker is only recognised
+        once the whitespace after it has arrived.
+        """
+        formatted = _format_bullets(text)
+        if final:
+            if formatted.startswith(emitted):
+                sys.stdout.write(f"{formatted[len(emitted):]}\n\n")
+            else:
+                sys.stdout.write(f"\n{formatted}\n\n")
+        else:
+            cut = max(formatted.rfind(" "), formatted.rfind("\n")) + 1
+            formatted = formatted[:cut]
+            if not formatted.startswith(emitted):
+                return emitted
+            sys.stdout.write(formatted[len(emitted) :])
+        sys.stdout.flush()
+        return formatted
+
+    # Track current selection index for CTRL+n cycling. (namespace, name)
+    # identifies a pod, so the index answers lookups without scanning.
+    pod_index = {(t[0], t[1]): i for i, t in enumerate(all_pods)}
+    current_idx = pod_index.get((ns, pod), 0)
 
     while True:
         user_input, ctrl_n = read_user_input_or_ctrl_n("👤 You: ")
         if ctrl_n:
             current_idx = (current_idx + 1) % len(all_pods)
             ns, pod, reason = all_pods[current_idx][0:3]
-            context = f"Pod {pod} in namespace {ns} is failing: {reason}"
+            header = f"Pod {pod} in namespace {ns} is failing: {reason}"
+            pod_description = summary = None
+            history.clear()
             print(f"\n🔄 Switched to pod {pod} (ns={ns}, reason={reason})")
             continue
         user_input = user_input.strip()
@@ -337,6 +959,23 @@ async def chat_loop(
             print("👋 Exiting debugger.")
             break
 
+        if user_input.lower() == "refresh":
+            refreshed = await get_failing_pods(pod_cache)
+            if pod_cache.watch_error is not None:
+                print(
+                    f"⚠️ Pod watch is failing, list may be stale: {pod_cache.watch_error}"
+                )
+            if not refreshed:
+                print("✅ No failing pods detected; keeping the current list.")
+                continue
+            all_pods = refreshed
+            pod_index = {(t[0], t[1]): i for i, t in enumerate(all_pods)}
+            # The session stays on the current pod; if it dropped out of the
+            # list, the next CTRL+n should land on the first entry.
+            current_idx = pod_index.get((ns, pod), -1)
+            print_failing_pods(all_pods)
+            continue
+
         # Deprecated switching via text command remains for compatibility
         if user_input.startswith("switch"):
             try:
@@ -344,7 +983,9 @@ async def chat_loop(
                 if 0 <= idx < len(all_pods):
                     current_idx = idx
                     ns, pod, reason = all_pods[current_idx][0:3]
-                    context = f"Pod {pod} in namespace {ns} is failing: {reason}"
+                    header = f"Pod {pod} in namespace {ns} is failing: {reason}"
+                    pod_description = summary = None
+                    history.clear()
                     print(f"\n🔄 Switched to pod {pod} (ns={ns}, reason={reason})")
                     continue
                 else:
@@ -355,20 +996,56 @@ async def chat_loop(
                 continue
 
         # Combine pod context + user input
-        user_prompt = f"{context}\nUser: {user_input}"
+        sections = [header]
+        if pod_description:
+            sections.append(f"# Pod description\n{pod_description}")
+        if summary:
+            sections.append(f"# Summary of earlier findings\n{summary}")
+        sections.extend(f"# {label}\n{body}" for label, body in history)
+        user_prompt = "\n\n".join(sections) + f"\nUser: {user_input}"
+
+        # Start the likely cluster call while the model is still thinking
+        spec_target, spec_task = start_speculative_action(
+            user_input, ns, pod, pod_cache
+        )
 
+        # Stream the response so long analyses start printing immediately;
+        # `streamed` holds the remediation text already written to stdout.
+        # The header waits until root_cause stops changing while remediation
+        # is arriving, so a half-streamed root cause is never printed.
+        streamed = None
+        shown_root_cause = None
+        last_root_cause = None
         try:
-            run_output = await agent.run(user_prompt=user_prompt)
+            async with agent.run_stream(user_prompt=user_prompt) as run_output:
+                async for partial in run_output.stream_output(debounce_by=None):
+                    if not isinstance(partial, FinalAnalysis):
+                        continue
+                    if streamed is None:
+                        stable = partial.root_cause == last_root_cause
+                        last_root_cause = partial.root_cause
+                        if not (stable and partial.root_cause and partial.remediation):
+                            continue
+                        print("\n✅ Final Analysis:")
+                        print(f"Root Cause: {partial.root_cause}")
+                        print("Remediation:")
+                        shown_root_cause = partial.root_cause
+                        streamed = ""
+                    streamed = _emit_remediation(partial.remediation, streamed)
+                result = await run_output.get_output()
         except Exception as e:
             print(f"\n❌ Error from model: {e}")
+            if spec_task is not None:
+                spec_task.cancel()
             continue
 
-        # Prefer the structured output if available
-        result = getattr(run_output, "output", None)
-        if result is None:
-            result = getattr(run_output, "data", None)
-        if result is None:
-            result = run_output
+        if spec_task is not None and not (
+            isinstance(result, ActionRequest)
+            and _action_target(result.type, result.namespace or ns, result.name or pod)
+            == spec_target
+        ):
+            spec_task.cancel()
+            spec_task = None
 
         if isinstance(result, ActionRequest):
             print(f"\n🤖 OpenAI requests action: {result}")
@@ -377,54 +1054,55 @@ async def chat_loop(
                 print("🛑 OpenAI requested to stop.")
                 return
 
+            if result.type == "SUMMARIZE":
+                if result.summary:
+                    summary = result.summary
+                    print(f"\n📝 Session summary updated:\n{summary}\n")
+                continue
+
             # Execute action
+            target_namespace = result.namespace or ns
+            # The current pod's description stays in the prompt outside the window
+            pinned = False
             if result.type == "DESCRIBE_POD":
-                output = run_cmd(
-                    [
-                        "kubectl",
-                        "describe",
-                        "pod",
-                        result.name,
-                        "-n",
-                        result.namespace,
-                    ]
-                )
+                if spec_task is not None:
+                    output = await spec_task
+                else:
+                    output = describe_pod(result.name or pod, target_namespace)
+                pinned = (target_namespace, result.name or pod) == (ns, pod)
+            elif result.type == "LOGS" and spec_task is not None:
+                output = await spec_task
             elif result.type == "LOGS":
-                target_namespace = result.namespace or ns
                 target_pod = result.name or pod
 
                 selected_container = None
                 try:
-                    v1 = client.CoreV1Api()
-                    pod_obj = v1.read_namespaced_pod(
-                        name=target_pod, namespace=target_namespace
-                    )
-
-                    container_names = []
-                    if getattr(pod_obj.spec, "init_containers", None):
-                        container_names.extend(
-                            [
-                                c.name
-                                for c in pod_obj.spec.init_containers
-                                if c and getattr(c, "name", None)
-                            ]
-                        )
-                    if getattr(pod_obj.spec, "containers", None):
-                        container_names.extend(
-                            [
-                                c.name
-                                for c in pod_obj.spec.containers
-                                if c and getattr(c, "name", None)
-                            ]
+                    # Container names come from the watch cache when the pod
+                    # is in scope; only pods outside it cost an extra read.
+                    pod_obj = pod_cache.get(target_namespace, target_pod)
+                    if pod_obj is None:
+                        pod_obj = _CORE_V1.read_namespaced_pod(
+                            name=target_pod, namespace=target_namespace
                         )
 
-                    unique_names = list(dict.fromkeys(container_names))
+                    seen = set()
+                    unique_names = []
+                    for c in itertools.chain(
+                        pod_obj.spec.init_containers or (),
+                        pod_obj.spec.containers or (),
+                    ):
+                        if c and c.name and c.name not in seen:
+                            seen.add(c.name)
+                            unique_names.append(c.name)
                     if len(unique_names) > 1:
                         print("\nMultiple containers detected in pod. Select one:")
                         for idx, cname in enumerate(unique_names, 1):
                             print(f"{idx}. {cname}")
                         while True:
                             try:
+                                # Blocking is fine here: the picker only runs
+                                # when no speculative fetch is pending, and a
+                                # plain input() keeps Ctrl+C working.
                                 choice = int(input("Select a container (number): ")) - 1
                                 if 0 <= choice < len(unique_names):
                                     selected_container = unique_names[choice]
@@ -438,67 +1116,50 @@ async def chat_loop(
                 except Exception as e:
                     print(f"⚠️ Could not enumerate containers: {e}")
 
-                cmd = [
-                    "kubectl",
-                    "logs",
-                    target_pod,
-                    "-n",
-                    target_namespace,
-                    "--tail=100",
-                ]
-                if selected_container:
-                    cmd.extend(["-c", selected_container])
-
-                output = run_cmd(cmd)
-            elif result.type == "DESCRIBE_DEPLOYMENT":
-                output = run_cmd(
-                    [
-                        "kubectl",
-                        "describe",
-                        "deployment",
-                        result.name,
-                        "-n",
-                        result.namespace,
-                    ]
+                output = get_pod_logs(
+                    target_pod, target_namespace, container=selected_container
                 )
+            elif result.type == "DESCRIBE_DEPLOYMENT":
+                output = describe_deployment(result.name, target_namespace)
             elif result.type == "GET_CONFIGMAP":
-                output = run_cmd(
-                    [
-                        "kubectl",
-                        "get",
-                        "configmap",
-                        result.name,
-                        "-n",
-                        result.namespace,
-                        "-o",
-                        "yaml",
-                    ]
-                )
+                output = get_configmap(result.name, target_namespace)
             elif result.type == "GET_EVENTS":
-                output = run_cmd(["kubectl", "get", "events", "-n", result.namespace])
+                if spec_task is not None:
+                    output = await spec_task
+                else:
+                    output = get_events(target_namespace)
             else:
                 output = f"⚠️ Unknown action: {result.type}"
 
             # print(f"\n📡 Cluster output for {result.type}:\n{output[:800]}...\n")
             print(f"\n📡 Cluster output for {result.type}:\n{output}...\n")
-            context += f"\n\n# Result of {result.type} ({result.namespace}/{result.name})\n{output}\n"
+            if pinned:
+                pod_description = output
+            else:
+                history.append(
+                    (
+                        f"Result of {result.type} ({result.namespace}/{result.name})",
+                        output,
+                    )
+                )
 
         elif isinstance(result, FinalAnalysis):
-            print("\n✅ Final Analysis:")
-            print(f"Root Cause: {result.root_cause}")
-
-            def _format_bullets(text: str) -> str:
-                try:
-                    # Insert newline before '-', '*', '•', or numbered bullets when not at start of line
-                    text = re.sub(r"(?<!^)(?<!\n)([-•*]\s+)", r"\n\1", text)
-                    text = re.sub(r"(?<!^)(?<!\n)(\d+\.\s+)", r"\n\1", text)
-                except Exception:
-                    pass
-                return text
-
             formatted_remediation = _format_bullets(result.remediation)
-            print(f"Remediation:\n{formatted_remediation}\n")
-            context += f"\n\n# Final Analysis\nRoot Cause: {result.root_cause}\nRemediation:\n{formatted_remediation}\n"
+            if streamed is None:
+                print("\n✅ Final Analysis:")
+                print(f"Root Cause: {result.root_cause}")
+                print(f"Remediation:\n{formatted_remediation}\n")
+            else:
+                _emit_remediation(result.remediation, streamed, final=True)
+                if result.root_cause != shown_root_cause:
+                    print(f"Root Cause: {result.root_cause}\n")
+            history.append(
+                (
+                    "Final Analysis",
+                    f"Root Cause: {result.root_cause}\n"
+                    f"Remediation:\n{formatted_remediation}",
+                )
+            )
         else:
             text = getattr(run_output, "output_text", None)
             if not text:
@@ -515,7 +1176,7 @@ async def chat_loop(
             if not text:
                 text = str(result)
             print(f"\n📝 Model response:\n{text}\n")
-            context += f"\n\n# Model Response\n{text}\n"
+            history.append(("Model Response", text))
 
 
 # ----------------------------
@@ -524,9 +1185,8 @@ async def chat_loop(
 if __name__ == "__main__":
     init_k8s()
     # List namespaces and prompt selection
-    v1_ns = client.CoreV1Api()
     try:
-        ns_list = v1_ns.list_namespace()
+        ns_list = list_all(_CORE_V1.list_namespace)
         namespaces = sorted([item.metadata.name for item in ns_list.items])
     except Exception:
         namespaces = []
@@ -556,22 +1216,21 @@ if __name__ == "__main__":
             except EOFError:
                 break
 
-    failing_pods = get_failing_pods(selected_ns)
+    pod_cache = PodCache(selected_ns)
+    pod_cache.start()
+    failing_pods = asyncio.run(get_failing_pods(pod_cache))
 
     if not failing_pods:
         print("✅ No failing pods detected.")
     else:
-        print("\n🚨 Failing pods detected:")
-        for i, (ns, pod, reason, ctrl_kind, ctrl_name) in enumerate(failing_pods, 1):
-            ctrl_info = f", {ctrl_kind}={ctrl_name}" if ctrl_kind and ctrl_name else ""
-            print(f"{i}. {pod} (ns={ns}, reason={reason}{ctrl_info})")
+        print_failing_pods(failing_pods)
 
         while True:
             try:
                 choice = int(input("\nSelect a pod to debug (number): "))
                 if 1 <= choice <= len(failing_pods):
                     ns, pod, reason, ctrl_kind, ctrl_name = failing_pods[choice - 1]
-                    asyncio.run(chat_loop(ns, pod, reason, failing_pods))
+                    asyncio.run(chat_loop(ns, pod, reason, failing_pods, pod_cache))
                     break
                 else:
                     print("❌ Invalid choice, try again.")